@@ -2,15 +2,11 @@
 Command-line interface for Augment VIP
 """
 
-import os
 import sys
 import click
-from pathlib import Path
 
 from . import __version__
-from .utils import info, success, error, warning
-from .db_cleaner import clean_vscode_db
-from .id_modifier import modify_telemetry_ids
+from .utils import info, success, error
 
 @click.group()
 @click.version_option(version=__version__)
@@ -21,6 +17,8 @@ def cli():
 @cli.command()
 def clean():
     """Clean VS Code databases by removing Augment-related entries"""
+    from .db_cleaner import clean_vscode_db
+
     if clean_vscode_db():
         success("Database cleaning completed successfully")
     else:
@@ -30,6 +28,8 @@ def clean():
 @cli.command()
 def modify_ids():
     """Modify VS Code telemetry IDs"""
+    from .id_modifier import modify_telemetry_ids
+
     if modify_telemetry_ids():
         success("Telemetry ID modification completed successfully")
     else:
@@ -39,6 +39,9 @@ def modify_ids():
 @cli.command()
 def all():
     """Run all tools (clean and modify IDs)"""
+    from .db_cleaner import clean_vscode_db
+    from .id_modifier import modify_telemetry_ids
+
     info("Running all tools...")
     
     clean_result = clean_vscode_db()
@@ -59,17 +62,21 @@ def install():
     # In Python, most of the installation is handled by pip/setup.py
     
     success("Augment VIP installed successfully")
-    info("You can now use the following commands:")
-    info("  - augment-vip clean: Clean VS Code databases")
-    info("  - augment-vip modify-ids: Modify telemetry IDs")
-    info("  - augment-vip all: Run all tools")
+    info(
+        "You can now use the following commands:\n"
+        "  - augment-vip clean: Clean VS Code databases\n"
+        "  - augment-vip modify-ids: Modify telemetry IDs\n"
+        "  - augment-vip all: Run all tools"
+    )
 
 def main():
     """Main entry point for the CLI"""
     try:
         cli()
-    except Exception as e:
-        error(f"Unexpected error: {e}")
+    except OSError as e:
+        # Click formats its own errors; only file system failures (e.g. a
+        # backup that cannot be written) need reporting here
+        error(f"I/O error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
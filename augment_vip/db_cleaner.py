@@ -2,14 +2,13 @@
 VS Code database cleaner module
 """
 
-import os
-import sys
 import sqlite3
-from pathlib import Path
-from typing import List, Dict, Any, Optional
 
 from .utils import info, success, error, warning, get_vscode_paths, backup_file
 
+# LIKE pattern for keys containing "augment", passed as a bound parameter
+_AUGMENT_PATTERN = "%augment%"
+
 def clean_vscode_db() -> bool:
     """
     Clean VS Code databases by removing entries containing "augment"
@@ -33,46 +32,38 @@ def clean_vscode_db() -> bool:
     backup_path = backup_file(state_db)
     
     # Connect to the database
+    conn = None
     try:
         # Connect to the original database
         conn = sqlite3.connect(str(state_db))
-        cursor = conn.cursor()
         
-        # Get the count of records before deletion
-        cursor.execute("SELECT COUNT(*) FROM ItemTable WHERE key LIKE '%augment%'")
-        count_before = cursor.fetchone()[0]
+        # Delete records containing "augment" in a single write transaction,
+        # committed when the block exits and rolled back if it fails
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            removed = conn.execute(
+                "DELETE FROM ItemTable WHERE key LIKE ?", (_AUGMENT_PATTERN,)
+            ).rowcount
         
-        if count_before == 0:
+        if removed == 0:
             info("No Augment-related entries found in the database")
-            conn.close()
             return True
         
-        # Delete records containing "augment"
-        cursor.execute("DELETE FROM ItemTable WHERE key LIKE '%augment%'")
-        conn.commit()
-        
-        # Get the count of records after deletion
-        cursor.execute("SELECT COUNT(*) FROM ItemTable WHERE key LIKE '%augment%'")
-        count_after = cursor.fetchone()[0]
-        
-        conn.close()
-        
-        success(f"Removed {count_before - count_after} Augment-related entries from the database")
+        success(f"Removed {removed} Augment-related entries from the database")
         return True
         
     except sqlite3.Error as e:
         error(f"SQLite error: {e}")
         
-        # Restore from backup if there was an error
-        if backup_path.exists():
-            info("Restoring from backup...")
-            try:
-                shutil.copy2(backup_path, state_db)
-                success("Restored from backup")
-            except Exception as restore_error:
-                error(f"Failed to restore from backup: {restore_error}")
+        # The DELETE runs in a single transaction, so a failure rolls it back
+        # and leaves the database untouched. Never write the backup over it:
+        # VS Code may still have the file open.
+        info(f"The database was not modified; a backup is kept at: {backup_path}")
         
         return False
     except Exception as e:
         error(f"Unexpected error: {e}")
         return False
+    finally:
+        if conn is not None:
+            conn.close()
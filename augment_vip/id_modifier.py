@@ -2,15 +2,11 @@
 VS Code telemetry ID modifier module
 """
 
-import os
-import sys
 import json
-from pathlib import Path
-from typing import Dict, Any, Optional
 
 from .utils import (
     info, success, error, warning, 
-    get_vscode_paths, backup_file,
+    get_vscode_paths, backup_file, atomic_write_bytes,
     generate_machine_id, generate_device_id
 )
 
@@ -43,16 +39,14 @@ def modify_telemetry_ids() -> bool:
     
     # Read the current file
     try:
-        with open(storage_json, 'r', encoding='utf-8') as f:
-            content = json.load(f)
+        content = json.loads(storage_json.read_bytes())
         
         # Update the values
         content["telemetry.machineId"] = machine_id
         content["telemetry.devDeviceId"] = device_id
         
         # Write the updated content back to the file
-        with open(storage_json, 'w', encoding='utf-8') as f:
-            json.dump(content, f, indent=2)
+        atomic_write_bytes(storage_json, json.dumps(content, indent=2).encode('utf-8'))
         
         success("Successfully updated telemetry IDs")
         info(f"New machineId: {machine_id}")
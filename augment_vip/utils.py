@@ -5,51 +5,61 @@ Utility functions for the Augment VIP project
 import os
 import sys
 import platform
-import json
-import sqlite3
 import uuid
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Dict
 
 # Console colors
-try:
-    from colorama import init, Fore, Style
-    init()  # Initialize colorama for Windows support
-    
-    def info(msg: str) -> None:
-        """Print an info message in blue"""
-        print(f"{Fore.BLUE}[INFO]{Style.RESET_ALL} {msg}")
-    
-    def success(msg: str) -> None:
-        """Print a success message in green"""
-        print(f"{Fore.GREEN}[SUCCESS]{Style.RESET_ALL} {msg}")
-    
-    def warning(msg: str) -> None:
-        """Print a warning message in yellow"""
-        print(f"{Fore.YELLOW}[WARNING]{Style.RESET_ALL} {msg}")
-    
-    def error(msg: str) -> None:
-        """Print an error message in red"""
-        print(f"{Fore.RED}[ERROR]{Style.RESET_ALL} {msg}")
-        
-except ImportError:
-    # Fallback if colorama is not installed
-    def info(msg: str) -> None:
-        print(f"[INFO] {msg}")
-    
-    def success(msg: str) -> None:
-        print(f"[SUCCESS] {msg}")
-    
-    def warning(msg: str) -> None:
-        print(f"[WARNING] {msg}")
-    
-    def error(msg: str) -> None:
-        print(f"[ERROR] {msg}")
+# Colors are only used on an interactive terminal and when NO_COLOR is unset,
+# so piped output and log files stay free of escape codes.
+_USE_COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
+if _USE_COLOR:
+    # colorama is only imported when its output will actually be colored,
+    # so piped runs skip the import and the stdout wrapper init() installs
+    try:
+        from colorama import init, Fore, Style
+        init()  # Initialize colorama for Windows support
+    except ImportError:
+        # Fallback if colorama is not installed
+        _USE_COLOR = False
+
+if _USE_COLOR:
+    _INFO_PREFIX = f"{Fore.BLUE}[INFO]{Style.RESET_ALL} "
+    _SUCCESS_PREFIX = f"{Fore.GREEN}[SUCCESS]{Style.RESET_ALL} "
+    _WARNING_PREFIX = f"{Fore.YELLOW}[WARNING]{Style.RESET_ALL} "
+    _ERROR_PREFIX = f"{Fore.RED}[ERROR]{Style.RESET_ALL} "
+else:
+    _INFO_PREFIX = "[INFO] "
+    _SUCCESS_PREFIX = "[SUCCESS] "
+    _WARNING_PREFIX = "[WARNING] "
+    _ERROR_PREFIX = "[ERROR] "
+
+def info(msg: str) -> None:
+    """Print an info message in blue"""
+    print(_INFO_PREFIX + msg)
+
+def success(msg: str) -> None:
+    """Print a success message in green"""
+    print(_SUCCESS_PREFIX + msg)
+
+def warning(msg: str) -> None:
+    """Print a warning message in yellow"""
+    print(_WARNING_PREFIX + msg)
 
+def error(msg: str) -> None:
+    """Print an error message in red"""
+    print(_ERROR_PREFIX + msg)
+
+@lru_cache(maxsize=None)
 def get_vscode_paths() -> Dict[str, Path]:
     """
     Get VS Code paths based on the operating system
+
+    The result is cached for the lifetime of the process, so the "all"
+    command only resolves the paths once. Callers must not modify it.
     
     Returns:
         Dict with paths to VS Code directories and files
@@ -92,19 +102,47 @@ def backup_file(file_path: Path) -> Path:
     Returns:
         Path to the backup file
     """
-    if not file_path.exists():
+    backup_path = Path(f"{file_path}.backup")
+    
+    # Let the copy report a missing source rather than stat-ing it first;
+    # callers have already checked that the file exists
+    try:
+        shutil.copy2(file_path, backup_path)
+    except FileNotFoundError:
         error(f"File not found: {file_path}")
         sys.exit(1)
-        
-    backup_path = Path(f"{file_path}.backup")
-    shutil.copy2(file_path, backup_path)
+    
     success(f"Created backup at: {backup_path}")
     
     return backup_path
 
+def atomic_write_bytes(file_path: Path, data: bytes) -> None:
+    """
+    Replace the contents of a file atomically
+    
+    The data is written and fsynced to a temporary file next to the target,
+    which is then renamed over it, so the file is never left half-written.
+    
+    Args:
+        file_path: Path to the file to write
+        data: New contents of the file
+    """
+    tmp_path = Path(f"{file_path}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
 def generate_machine_id() -> str:
     """Generate a random 64-character hex string for machineId"""
-    return uuid.uuid4().hex + uuid.uuid4().hex
+    return os.urandom(32).hex()
 
 def generate_device_id() -> str:
     """Generate a random UUID v4 for devDeviceId"""
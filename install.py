@@ -85,8 +85,13 @@ def install_package(venv_path, package_path="."):
     info(f"Installing Augment VIP package...")
 
     try:
-        # Install the package in development mode
-        subprocess.check_call([str(pip_path), "install", "-e", package_path])
+        # Install the package in development mode. Skip pip's self-update
+        # check and never wait on stdin, so the install is a single pass
+        subprocess.check_call([
+            str(pip_path), "install",
+            "--disable-pip-version-check", "--no-input",
+            "-e", str(package_path),
+        ])
         success("Augment VIP package installed successfully")
         return True
     except subprocess.CalledProcessError as e: